@@ -1,12 +1,25 @@
+import hashlib
 import logging
+import os
+import sys
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from typing import Any
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request, Response
-
-from openlibrary_mcp.providers import OpenLibraryProvider
+from cachetools import TTLCache
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+
+from openlibrary_mcp.providers import (
+    CACHE_MAX_SIZE,
+    CACHE_TTL_SECONDS,
+    OpenLibraryProvider,
+    aclose_client,
+    cache_clear,
+    get_provider,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -15,34 +28,100 @@ logging.basicConfig(
     level=logging.INFO,
 )
 
+
+# Serialized /search responses keyed by normalized query: hits skip
+# model_dump_json, JSON encoding, and the ETag hash entirely
+_search_response_cache: "TTLCache[str, tuple[str, bytes]]" = TTLCache(
+    maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS
+)
+
+
+def _compute_etag(body: bytes) -> str:
+    """Compute the strong ETag value for a response body"""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Close the shared OpenLibrary HTTP client on shutdown"""
+    yield
+    await aclose_client()
+
+
 app = FastAPI(
     title="Books MCP FastAPI Server",
     description="Search for books using OpenLibrary API",
     version="0.1.1",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
+# uvicorn already emits an access log, so the custom per-request logging
+# middleware is opt-in: it adds measurable constant overhead to fast
+# endpoints like /health (relevant under readiness/liveness probes)
+if os.getenv("REQUEST_LOG"):
+
+    @app.middleware("http")
+    async def log_requests(
+        request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        """Log all incoming requests"""
+        start_time = time.perf_counter()
+
+        # dict(request.query_params) is not free, so only materialize it
+        # when the log line will actually be emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "🌐 %s %s - Query: %s",
+                request.method,
+                request.url.path,
+                dict(request.query_params),
+            )
+
+        response = await call_next(request)
+
+        process_time = time.perf_counter() - start_time
+        logger.info("📊 Response: %s | Time: %.3fs", response.status_code, process_time)
+
+        return response
+
+
 @app.middleware("http")
-async def log_requests(
+async def etag_responses(
     request: Request, call_next: Callable[[Request], Awaitable[Response]]
 ) -> Response:
-    """Log all incoming requests"""
-    start_time = time.time()
-
-    logger.info(
-        f"🌐 {request.method} {request.url.path} - Query: {dict(request.query_params)}"
-    )
-
+    """Attach an ETag to GET responses and honor If-None-Match with a 304"""
     response = await call_next(request)
 
-    process_time = time.time() - start_time
-    logger.info(f"📊 Response: {response.status_code} | Time: {process_time:.3f}s")
-
-    return response
+    if request.method != "GET" or response.status_code != 200:
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore[attr-defined]
+    etag = response.headers.get("etag")
+    if etag is None:
+        etag = _compute_etag(body)
+
+    if request.headers.get("if-none-match") == etag:
+        logger.debug("🏷️  ETag match for %s, returning 304", request.url.path)
+        return Response(status_code=304, headers={"ETag": etag})
+
+    # Headers keys are lowercased by starlette; reusing "etag" avoids a
+    # duplicate header when the handler already attached one
+    headers = dict(response.headers)
+    headers["etag"] = etag
+    return Response(
+        content=body,
+        status_code=response.status_code,
+        headers=headers,
+        media_type=response.media_type,
+    )
 
 
 @app.get("/search")
-async def search_books(query: str) -> Any:
+async def search_books(
+    query: str, provider: OpenLibraryProvider = Depends(get_provider)
+) -> Any:
     """Search for books using OpenLibrary API"""
     logger.info(f"🔍 FastAPI endpoint called: /search with query='{query}'")
 
@@ -50,8 +129,16 @@ async def search_books(query: str) -> Any:
         logger.warning("⚠️  Empty search query provided")
         raise HTTPException(status_code=400, detail="Query parameter cannot be empty")
 
+    cache_key = query.strip().lower()
+    cached = _search_response_cache.get(cache_key)
+    if cached is not None:
+        etag, body = cached
+        logger.debug("♻️  Serving cached /search response for '%s'", cache_key)
+        return Response(
+            content=body, media_type="application/json", headers={"ETag": etag}
+        )
+
     try:
-        provider = OpenLibraryProvider()
         result = await provider.search_books(query)
 
         logger.info(
@@ -66,8 +153,15 @@ async def search_books(query: str) -> Any:
         }
         logger.debug(f"📈 Response summary: {response_summary}")
 
-        # Convert to dict for proper JSON serialization
-        return result.model_dump()
+        # The model is frozen, so its serialized bytes and ETag can be
+        # cached for the TTL window and replayed without re-encoding
+        body = result.model_dump_json().encode()
+        etag = _compute_etag(body)
+        _search_response_cache[cache_key] = (etag, body)
+
+        return Response(
+            content=body, media_type="application/json", headers={"ETag": etag}
+        )
 
     except Exception as e:
         logger.error(f"❌ FastAPI search failed: {e}")
@@ -75,7 +169,9 @@ async def search_books(query: str) -> Any:
 
 
 @app.get("/search_author_with_book_name")
-async def search_author_with_book_name(query: str) -> Any:
+async def search_author_with_book_name(
+    query: str, provider: OpenLibraryProvider = Depends(get_provider)
+) -> Any:
     """Search for author using OpenLibrary API"""
     logger.info(
         f"🔍 FastAPI endpoint called: /search_author_with_book_name with query='{query}'"
@@ -86,12 +182,11 @@ async def search_author_with_book_name(query: str) -> Any:
         raise HTTPException(status_code=400, detail="Query parameter cannot be empty")
 
     try:
-        provider = OpenLibraryProvider()
         result = await provider.search_author_with_book_name(query)
 
         logger.info(f"✅ FastAPI author search completed successfully: {result.name}")
 
-        return result.model_dump()
+        return result
 
     except Exception as e:
         logger.error(f"❌ FastAPI author search failed: {e}")
@@ -99,7 +194,9 @@ async def search_author_with_book_name(query: str) -> Any:
 
 
 @app.get("/search_author")
-async def search_author(query: str) -> Any:
+async def search_author(
+    query: str, provider: OpenLibraryProvider = Depends(get_provider)
+) -> Any:
     """Search for author using OpenLibrary API"""
     logger.info(f"🔍 FastAPI endpoint called: /search_author with query='{query}'")
 
@@ -108,18 +205,26 @@ async def search_author(query: str) -> Any:
         raise HTTPException(status_code=400, detail="Query parameter cannot be empty")
 
     try:
-        provider = OpenLibraryProvider()
         result = await provider.search_author(query)
 
         logger.info(f"✅ FastAPI author search completed successfully: {result.name}")
 
-        return result.model_dump()
+        return result
 
     except Exception as e:
         logger.error(f"❌ FastAPI author search failed: {e}")
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}") from e
 
 
+@app.post("/cache/clear")
+async def clear_cache() -> dict[str, str]:
+    """Clear the provider's in-memory response caches"""
+    logger.info("🧹 Cache clear requested")
+    cache_clear()
+    _search_response_cache.clear()
+    return {"status": "cleared"}
+
+
 @app.get("/health")
 async def health_check() -> dict[str, str]:
     """Health check endpoint"""
@@ -149,4 +254,27 @@ if __name__ == "__main__":
     logger.info("📡 Server will be available at: http://localhost:8000")
     logger.info("📚 API documentation at: http://localhost:8000/docs")
 
-    uvicorn.run(app, host="localhost", port=8000)
+    # Multiple workers spread the CPU-bound JSON + Pydantic work across
+    # cores; the app is passed by import string so uvicorn can spawn
+    # worker processes (each worker gets its own pooled client).
+    workers = max(2, os.cpu_count() or 1)
+
+    if sys.platform != "win32":
+        # uvloop + httptools are POSIX-only drop-in replacements for the
+        # stdlib event loop and h11 parser; both endpoints are I/O-bound
+        # proxies so the event loop is the hot path.
+        uvicorn.run(
+            "openlibrary_mcp.fastapi_server:app",
+            host="localhost",
+            port=8000,
+            workers=workers,
+            loop="uvloop",
+            http="httptools",
+        )
+    else:
+        uvicorn.run(
+            "openlibrary_mcp.fastapi_server:app",
+            host="localhost",
+            port=8000,
+            workers=workers,
+        )
@@ -1,24 +1,272 @@
+import asyncio
+import atexit
+import functools
 import logging
+import os
+import queue
 import sys
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, TypeVar, cast
 
+import orjson
+from cachetools import TTLCache
 from fastmcp import FastMCP
+from pydantic import BaseModel
 
 from openlibrary_mcp.models import AuthorDetails, OpenLibrary
-from openlibrary_mcp.providers import OpenLibraryProvider
+from openlibrary_mcp.providers import aclose_client, get_client, get_provider
+from openlibrary_mcp.resilience import AdaptiveLimiter, CircuitBreaker
 
-# Configure logging for Claude Desktop (stderr only)
+# Configure logging for Claude Desktop (stderr only; stdout carries the
+# MCP stdio protocol). Records are routed through a queue drained by a
+# background thread so tool coroutines never block on stderr writes.
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    stream=sys.stderr,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    level=logging.INFO,
-)
+
+
+class _JsonFormatter(logging.Formatter):
+    """
+    Render each log record as one orjson-encoded object per line.
+
+    Downstream aggregators can ingest the stream without a regex parse
+    stage, and the encoding runs on the queue listener thread, off the
+    event loop.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload).decode()
+
+
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_stderr_handler = logging.StreamHandler(sys.stderr)
+# Humans at a terminal get the readable text format; piped stderr gets
+# machine-parseable JSON lines (same TTY test that gates the emoji)
+if sys.stderr.isatty():
+    _stderr_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+else:
+    _stderr_handler.setFormatter(_JsonFormatter())
+
+# Imported modules may already have attached a direct stream handler via
+# basicConfig; replace it so every record goes through the queue instead
+_root_logger = logging.getLogger()
+for _handler in _root_logger.handlers[:]:
+    _root_logger.removeHandler(_handler)
+_root_logger.addHandler(QueueHandler(_log_queue))
+_root_logger.setLevel(logging.INFO)
+
+_log_listener = QueueListener(_log_queue, _stderr_handler)
+_log_listener.start()
+
+
+@atexit.register
+def _stop_log_listener() -> None:
+    """Flush and stop the log listener thread, tolerating a prior stop."""
+    if _log_listener._thread is not None:
+        _log_listener.stop()
+
+
+def _serialize_tool_result(result: Any) -> str:
+    """
+    Serialize tool return values with orjson.
+
+    The search_books response can carry thousands of docs; orjson encodes
+    it several times faster than the default json path, shrinking the
+    stdio write window per tool call.
+
+    Args:
+        result: The tool's return value (Pydantic model or plain data)
+
+    Returns:
+        The JSON string sent back over the MCP transport
+    """
+    if isinstance(result, BaseModel):
+        result = result.model_dump()
+    return orjson.dumps(result).decode()
+
+
+@asynccontextmanager
+async def _lifespan(app: "FastMCP[None]") -> AsyncIterator[None]:
+    """Warm the upstream connection at startup; close the client on shutdown.
+
+    The warm-up runs as a background task on the serving loop so startup
+    is not delayed, and the warmed keep-alive connection remains in the
+    shared client's pool for the first tool call.
+    """
+    warmup = asyncio.create_task(_prewarm())
+    try:
+        yield
+    finally:
+        if not warmup.done():
+            warmup.cancel()
+        await aclose_client()
+
 
 app = FastMCP(
     name="openlibrary-mcp",
     version="0.1.1",
+    tool_serializer=_serialize_tool_result,
+    lifespan=_lifespan,
 )
 
+TOOL_CACHE_MAX_SIZE = 512
+TOOL_CACHE_TTL_SECONDS = 300.0
+
+# Tool-level TTL cache keyed by (tool name, normalized query). LLM clients
+# commonly re-ask identical queries; hits skip the provider layer entirely,
+# including the composite search_author_with_book_name chain which the
+# provider caches do not cover as a whole.
+_tool_cache: "TTLCache[tuple[str, str], Any]" = TTLCache(
+    maxsize=TOOL_CACHE_MAX_SIZE, ttl=TOOL_CACHE_TTL_SECONDS
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Admission control: an AIMD limiter that adapts its concurrency to
+# upstream health (replacing the earlier static semaphore) plus a circuit
+# breaker that short-circuits calls while openlibrary.org is failing
+OUTBOUND_CONCURRENCY = int(os.getenv("OPENLIBRARY_MAX_CONCURRENCY", "16"))
+_outbound_limiter = AdaptiveLimiter(initial=OUTBOUND_CONCURRENCY)
+_breaker = CircuitBreaker()
+
+
+# In-flight futures keyed like the tool cache so concurrent identical
+# invocations coalesce into one upstream request even when TTL caching
+# misses (or is disabled)
+_tool_inflight: dict[tuple[str, str], "asyncio.Future[Any]"] = {}
+
+
+def _cached_tool(func: F) -> F:
+    """
+    Cache the tool dispatcher on (method, normalized query) for the TTL window.
+
+    Concurrent identical invocations are coalesced: while one call is in
+    flight, later callers with the same key await its future instead of
+    issuing their own upstream requests.
+
+    Args:
+        func: The dispatcher coroutine taking a provider method name and query
+
+    Returns:
+        The wrapped coroutine with caching and single-flight dedup
+    """
+
+    @functools.wraps(func)
+    async def wrapper(method: str, query: str) -> Any:
+        key = (method, query.strip().lower())
+
+        cached = _tool_cache.get(key)
+        if cached is not None:
+            logger.debug("♻️  Tool cache hit for %s: '%s'", key[0], key[1])
+            return cached
+
+        fut = _tool_inflight.get(key)
+        if fut is not None:
+            logger.debug("⏳ Awaiting in-flight %s for: '%s'", key[0], key[1])
+            return await fut
+
+        fut = asyncio.get_running_loop().create_future()
+        _tool_inflight[key] = fut
+        try:
+            result = await func(method, query)
+        except Exception as e:
+            fut.set_exception(e)
+            # Mark the exception as retrieved so the future does not warn
+            # if no concurrent caller was awaiting it
+            fut.exception()
+            raise
+        else:
+            _tool_cache[key] = result
+            fut.set_result(result)
+            return result
+        finally:
+            _tool_inflight.pop(key, None)
+            if not fut.done():
+                # The leader was cancelled before resolving (only
+                # Exception is caught above); cancel the future so
+                # duplicate waiters don't hang forever
+                fut.cancel()
+
+    return cast(F, wrapper)
+
+
+# Emoji prefixes are for humans watching a terminal; when stderr is a
+# pipe to a log collector they are just extra UTF-8 bytes per record
+if sys.stderr.isatty():
+    _EMOJI_CALL, _EMOJI_OK, _EMOJI_ERR = "🔍 ", "✅ ", "❌ "
+else:
+    _EMOJI_CALL = _EMOJI_OK = _EMOJI_ERR = ""
+
+MAX_QUERY_LENGTH = 512
+
+# Shared empty result for blank book searches; the model is frozen, so
+# one instance can be handed out to every caller
+_EMPTY_BOOKS_RESULT = OpenLibrary(num_found=0, q="", docs=[])
+
+
+def _validate_query(query: str) -> str:
+    """
+    Normalize a query and reject oversized inputs before any network I/O.
+
+    Collapses internal whitespace and lowercases so equivalent queries
+    share one cache key, and raises on absurdly long input instead of
+    round-tripping it to OpenLibrary.
+
+    Args:
+        query: The raw user-supplied query string
+
+    Returns:
+        The normalized query (possibly empty)
+
+    Raises:
+        ValueError: If the normalized query exceeds MAX_QUERY_LENGTH
+    """
+    normalized = " ".join(query.split()).lower()
+    if len(normalized) > MAX_QUERY_LENGTH:
+        raise ValueError(
+            f"Query too long ({len(normalized)} chars, max {MAX_QUERY_LENGTH})"
+        )
+    return normalized
+
+
+@_cached_tool
+async def _invoke(method: str, query: str) -> Any:
+    """
+    Dispatch a tool call to the named provider method.
+
+    Single place where the cache, circuit breaker, and adaptive limiter
+    are applied, so every tool gets the same admission control and
+    error handling without repeating the skeleton per tool.
+
+    Args:
+        method: Name of the OpenLibraryProvider method to call
+        query: The user-supplied query string
+
+    Returns:
+        Whatever the provider method returns
+    """
+    logger.info("%sMCP tool called: %s with query='%s'", _EMOJI_CALL, method, query)
+
+    try:
+        async with _breaker, _outbound_limiter:
+            result = await getattr(get_provider(), method)(query)
+
+        logger.info("%sMCP %s completed successfully", _EMOJI_OK, method)
+        return result
+    except Exception as e:
+        logger.error("%sMCP %s failed: %s", _EMOJI_ERR, method, e)
+        raise
+
 
 @app.tool()
 async def search_books(query: str) -> OpenLibrary:
@@ -36,20 +284,10 @@ async def search_books(query: str) -> OpenLibrary:
         - search_books("lord of the rings tolkien")
         - search_books("george orwell 1984")
     """
-    logger.info(f"🔍 MCP tool called: search_books with query='{query}'")
-
-    try:
-        provider = OpenLibraryProvider()
-        result = await provider.search_books(query)
-
-        logger.info(
-            f"✅ MCP search_books completed successfully: {result.num_found} books found"
-        )
-        return result
-
-    except Exception as e:
-        logger.error(f"❌ MCP search_books failed: {e}")
-        raise
+    query = _validate_query(query)
+    if not query:
+        return _EMPTY_BOOKS_RESULT
+    return cast(OpenLibrary, await _invoke("search_books", query))
 
 
 @app.tool()
@@ -57,21 +295,10 @@ async def search_author_with_book_name(query: str) -> AuthorDetails:
     """
     Search for author with book name using the OpenLibrary API.
     """
-    logger.info(
-        f"🔍 MCP tool called: search_author_with_book_name with query='{query}'"
-    )
-
-    try:
-        provider = OpenLibraryProvider()
-        result = await provider.search_author_with_book_name(query)
-
-        logger.info(
-            f"✅ MCP search_author_with_book_name completed successfully: {result.name}"
-        )
-        return result
-    except Exception as e:
-        logger.error(f"❌ MCP search_author_with_book_name failed: {e}")
-        raise
+    query = _validate_query(query)
+    if not query:
+        raise ValueError("Query cannot be empty")
+    return cast(AuthorDetails, await _invoke("search_author_with_book_name", query))
 
 
 @app.tool()
@@ -79,21 +306,52 @@ async def search_author(query: str) -> AuthorDetails:
     """
     Search for author using the OpenLibrary API.
     """
-    logger.info(f"🔍 MCP tool called: search_author with query='{query}'")
+    query = _validate_query(query)
+    if not query:
+        raise ValueError("Query cannot be empty")
+    return cast(AuthorDetails, await _invoke("search_author", query))
 
-    try:
-        provider = OpenLibraryProvider()
-        result = await provider.search_author(query)
 
-        logger.info(f"✅ MCP search_author completed successfully: {result.name}")
-        return result
+def _install_event_loop_policy() -> None:
+    """Install a libuv-backed event loop when available (uvloop/winloop)."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("⚡ uvloop event loop policy installed")
+        except ImportError:
+            pass
+    else:
+        try:
+            import winloop
+
+            asyncio.set_event_loop_policy(winloop.EventLoopPolicy())
+            logger.info("⚡ winloop event loop policy installed")
+        except ImportError:
+            pass
+
+
+async def _prewarm() -> None:
+    """
+    Resolve DNS and touch the search endpoint before the first tool call.
+
+    Moves the cold-start cost (DNS lookup, TCP+TLS handshake) out of the
+    first user-visible tool call; the warmed keep-alive connection stays
+    in the shared client's pool. Failures are logged and ignored — the
+    server must still serve when openlibrary.org is unreachable.
+    """
+    try:
+        response = await get_client().head("/search.json", params={"q": "ping"})
+        logger.info("🔥 Upstream pre-warmed (status %s)", response.status_code)
     except Exception as e:
-        logger.error(f"❌ MCP search_author failed: {e}")
-        raise
+        logger.warning("⚠️  Pre-warm failed, continuing startup: %s", e)
 
 
 def main() -> None:
     """Main function to run the MCP server for Claude Desktop integration."""
+    _install_event_loop_policy()
+
     logger.info("🚀 Starting Books MCP server for Claude Desktop...")
     logger.info("🔧 Using stdio transport for Claude Desktop integration")
 
@@ -103,7 +361,7 @@ def main() -> None:
     except KeyboardInterrupt:
         logger.info("⏹️  Server stopped by user")
     except Exception as e:
-        logger.error(f"💥 Server error: {e}")
+        logger.error("💥 Server error: %s", e)
         print(f"💥 Server error: {e}", file=sys.stderr)
         raise
 
@@ -1,8 +1,9 @@
 import logging
+import os
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -11,6 +12,14 @@ logging.basicConfig(
     level=logging.INFO,
 )
 
+# Latest plausible publish year, evaluated once at import instead of per
+# class (re)definition
+MAX_YEAR = datetime.now().year + 1
+
+# Escape hatch: force full Pydantic validation of upstream payloads when
+# debugging shape changes in the OpenLibrary API
+STRICT_VALIDATION = bool(os.getenv("OPENLIBRARY_STRICT_VALIDATION"))
+
 
 class BookDetails(BaseModel):
     """
@@ -19,7 +28,10 @@ class BookDetails(BaseModel):
     Represents individual book information from the OpenLibrary search results.
     """
 
-    model_config = ConfigDict(extra="ignore", validate_default=True)
+    # validate_default is off: every default here is None and nothing relies
+    # on defaults being coerced, so re-validating them per instance is waste.
+    # Docs are read-only after construction, so freeze them.
+    model_config = ConfigDict(extra="ignore", validate_default=False, frozen=True)
 
     author_name: str | None = Field(None, description="Name of the book's author")
     author_key: str | None = Field(None, description="Key of the book's author")
@@ -29,7 +41,7 @@ class BookDetails(BaseModel):
     first_publish_year: int | None = Field(
         None,
         ge=1000,
-        le=datetime.now().year + 1,
+        le=MAX_YEAR,
         description="Year the book was first published",
     )
     language: str | list[str] | None = Field(
@@ -37,93 +49,58 @@ class BookDetails(BaseModel):
     )
     title: str | None = Field(None, description="Title of the book")
 
-    @field_validator("author_name", "author_key", mode="before")
-    def validate_author_fields(cls, v: str | list[str] | None) -> str | None:
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_fields(cls, data: Any) -> Any:
         """
-        Validate author fields by extracting first element if it's a list.
+        Normalize raw OpenLibrary doc fields in a single pass.
+
+        Collapses list-valued author fields and languages to their first
+        element and cleans the title, replacing three per-field validators
+        with one callback per doc on the construction hot path.
 
         Args:
-            v: The value to validate (can be str, list, or None)
+            data: The raw doc dict from the OpenLibrary API
 
         Returns:
-            str or None: The validated author field value
+            The normalized data ready for field validation
         """
-        if v is None:
-            return None
-
-        if isinstance(v, list):
-            if len(v) > 0:
-                logger.debug(
-                    f"📝 Author validation: Converting list {v} to first element: '{v[0]}'"
-                )
-                return v[0]
-            else:
-                logger.debug(
-                    "📝 Author validation: Empty list provided, returning None"
-                )
-                return None
-
-        logger.debug(f"📝 Author validation: Using string value: '{v}'")
-        return v
-
-    @field_validator("language", mode="before")
-    def validate_language(cls, v: str | list[str] | None) -> str | None:
-        """
-        Validate language field by normalizing it to a consistent format.
+        if not isinstance(data, dict):
+            return data
 
-        Args:
-            v: The value to validate (can be str, list, or None)
+        for field in ("author_name", "author_key", "language"):
+            value = data.get(field)
+            if isinstance(value, list):
+                data[field] = value[0] if value else None
 
-        Returns:
-            str or None: The primary language if multiple languages are provided
-        """
-        if v is None:
-            return None
-
-        if isinstance(v, list):
-            if len(v) > 0:
-                logger.debug(
-                    f"🌍 Language validation: Multiple languages {v}, using primary: '{v[0]}'"
-                )
-                return v[0]  # Return primary language
-            else:
-                logger.debug("🌍 Language validation: Empty language list provided")
-                return None
-
-        logger.debug(f"🌍 Language validation: Using single language: '{v}'")
-        return v
-
-    @field_validator("title", mode="before")
-    def validate_title(cls, v: Any) -> str | None:
-        """
-        Validate and clean title field.
+        title = data.get("title")
+        if isinstance(title, str):
+            data["title"] = title.strip()
+        elif title is not None:
+            data["title"] = str(title) if title else None
 
-        Args:
-            v: The title value to validate
+        return data
 
-        Returns:
-            str or None: The cleaned title
-        """
-        if v is None:
-            return None
-
-        if isinstance(v, str):
-            cleaned = v.strip()
-            if cleaned != v:
-                logger.debug(
-                    f"📖 Title validation: Cleaned whitespace from '{v}' to '{cleaned}'"
-                )
-            return cleaned
-
-        # Convert non-string to string if not None
-        if v:
-            result = str(v)
-            logger.debug(
-                f"📖 Title validation: Converted {type(v).__name__} to string: '{result}'"
-            )
-            return result
 
-        return None
+# Bulk adapter so a whole docs list validates in a single pydantic-core
+# call instead of one Python-level BaseModel construction per doc
+BOOK_LIST_ADAPTER: TypeAdapter[list[BookDetails]] = TypeAdapter(list[BookDetails])
+
+
+def _log_incomplete_docs(docs_data: list[dict[str, Any]]) -> None:
+    """Log how many raw docs are missing title or author_name"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    incomplete_books = sum(
+        1 for doc in docs_data if not (doc.get("title") and doc.get("author_name"))
+    )
+    if incomplete_books > 0:
+        logger.info(
+            "⚠️  %s/%s books have missing critical fields",
+            incomplete_books,
+            len(docs_data),
+        )
 
 
 class OpenLibrary(BaseModel):
@@ -133,7 +110,9 @@ class OpenLibrary(BaseModel):
     Represents the complete response from OpenLibrary search API.
     """
 
-    model_config = ConfigDict(extra="ignore", validate_default=True)
+    # Responses are read-only once built, which lets callers cache the
+    # serialized JSON bytes alongside the model
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     num_found: int = Field(description="Total number of books found in the search")
     q: str = Field(description="The search query that was executed")
@@ -143,32 +122,54 @@ class OpenLibrary(BaseModel):
 
     def __init__(self, **data: Any) -> None:
         """Initialize OpenLibrary model with logging"""
-        logger.debug(
-            f"🏗️  Creating OpenLibrary model with {len(data.get('docs', []))} book records"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "🏗️  Creating OpenLibrary model with %s book records",
+                len(data.get("docs", [])),
+            )
 
-        # Track validation issues
+        # Track validation issues on the hot construction path
         docs_data = data.get("docs", [])
         if docs_data:
-            incomplete_books = 0
-            for doc in docs_data:
-                required_fields = ["title", "author_name"]
-                missing_fields = [
-                    field for field in required_fields if not doc.get(field)
-                ]
-                if missing_fields:
-                    incomplete_books += 1
-
-            if incomplete_books > 0:
-                logger.info(
-                    f"⚠️  {incomplete_books}/{len(docs_data)} books have missing critical fields"
-                )
+            _log_incomplete_docs(docs_data)
 
         super().__init__(**data)
 
         # Log successful creation
         logger.debug(
-            f"✅ OpenLibrary model created successfully: {self.num_found} total, {len(self.docs)} processed"
+            "✅ OpenLibrary model created successfully: %s total, %s processed",
+            self.num_found,
+            len(self.docs),
+        )
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> "OpenLibrary":
+        """
+        Build an OpenLibrary response from a raw API payload.
+
+        Validates the docs list in a single pydantic-core call through
+        BOOK_LIST_ADAPTER, then assembles the model with model_construct
+        so the already-validated docs are not re-validated.
+
+        Args:
+            data: The decoded JSON payload from the search endpoint
+
+        Returns:
+            OpenLibrary: The parsed response model
+        """
+        if STRICT_VALIDATION:
+            return cls(**data)
+
+        docs_data = data.get("docs", [])
+        if docs_data:
+            _log_incomplete_docs(docs_data)
+
+        # The top-level fields come from trusted upstream JSON; coerce
+        # them directly and only spend validation on the docs list
+        return cls.model_construct(
+            num_found=int(data.get("num_found", 0)),
+            q=str(data.get("q", "")),
+            docs=BOOK_LIST_ADAPTER.validate_python(docs_data),
         )
 
 
@@ -177,26 +178,35 @@ class AuthorWorks(BaseModel):
     Author works model for OpenLibrary API response.
     """
 
-    model_config = ConfigDict(extra="ignore", validate_default=True)
+    # Works are read-only once parsed; freezing keeps the instances safely
+    # shareable between the works cache and every AuthorDetails they join
+    model_config = ConfigDict(extra="ignore", frozen=True)
     author_id: str | None = Field(None, description="Author ID")
     title: str | None = Field(None, description="Title of the work")
     subtitle: str | None = Field(None, description="Subtitle of the work")
 
     def __init__(self, **data: Any) -> None:
         """Initialize AuthorWorks model with logging"""
-        logger.debug(
-            f"🏗️  Creating AuthorWorks model with {len(data.get('title', []))} title and {len(data.get('subtitle', []))} subtitle"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "🏗️  Creating AuthorWorks model with %s title and %s subtitle",
+                len(data.get("title", [])),
+                len(data.get("subtitle", [])),
+            )
 
         super().__init__(**data)
 
 
+# Bulk adapter mirroring BOOK_LIST_ADAPTER for author works lists
+WORKS_ADAPTER: TypeAdapter[list[AuthorWorks]] = TypeAdapter(list[AuthorWorks])
+
+
 class AuthorDetails(BaseModel):
     """
     Author details model for OpenLibrary API response.
     """
 
-    model_config = ConfigDict(extra="ignore", validate_default=True)
+    model_config = ConfigDict(extra="ignore")
     key: str | None = Field(None, description="Author key")
     alternate_names: list[str] | None = Field(
         None, description="Alternate names for the book"
@@ -213,9 +223,12 @@ class AuthorDetails(BaseModel):
 
     def __init__(self, **data: Any) -> None:
         """Initialize AuthorDetails model with logging"""
-        logger.debug(
-            f"🏗️  Creating AuthorDetails model with {len(data.get('alternate_names', []))} alternate names and {len(data.get('works', []))} works"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "🏗️  Creating AuthorDetails model with %s alternate names and %s works",
+                len(data.get("alternate_names", [])),
+                len(data.get("works", [])),
+            )
 
         super().__init__(**data)
 
@@ -225,4 +238,4 @@ class AuthorDetails(BaseModel):
             self.works = []
 
         self.works.extend(works)
-        logger.debug(f"✅ AuthorDetails model updated with {len(works)} works")
+        logger.debug("✅ AuthorDetails model updated with %s works", len(works))
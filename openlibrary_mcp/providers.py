@@ -1,8 +1,20 @@
+import asyncio
+import functools
 import logging
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
 
 import httpx
-
-from openlibrary_mcp.models import AuthorDetails, AuthorWorks, OpenLibrary
+import orjson
+from cachetools import TTLCache
+
+from openlibrary_mcp.models import (
+    WORKS_ADAPTER,
+    AuthorDetails,
+    AuthorWorks,
+    OpenLibrary,
+)
+from openlibrary_mcp.resilience import RateLimitState, retry_on_transient
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -10,180 +22,336 @@ logging.basicConfig(
     level=logging.INFO,
 )
 
+BASE_URL = "https://openlibrary.org"
 
-class OpenLibraryProvider:
-    def __init__(self) -> None:
-        self.base_url = "https://openlibrary.org"
-        logger.info(
-            f"🔧 OpenLibraryProvider initialized with base_url: {self.base_url}"
+CACHE_MAX_SIZE = 1024
+CACHE_TTL_SECONDS = 300.0
+
+# Per-method TTL caches keyed by normalized query so repeated lookups of
+# popular titles skip the network round-trip and Pydantic revalidation.
+_books_cache: "TTLCache[str, OpenLibrary]" = TTLCache(
+    maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS
+)
+_author_cache: "TTLCache[str, AuthorDetails]" = TTLCache(
+    maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS
+)
+_works_cache: "TTLCache[str, list[AuthorWorks]]" = TTLCache(
+    maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _ttl_cached(cache: "TTLCache[str, Any]") -> Callable[[F], F]:
+    """
+    Cache an async provider method on its normalized string argument.
+
+    Also coalesces concurrent identical calls: between a cache miss and
+    the cache being populated, callers with the same key await a single
+    in-flight future instead of each issuing an upstream request.
+
+    Args:
+        cache: The TTL cache to store parsed results in
+
+    Returns:
+        Decorator wrapping the method with cache lookup and single-flight
+    """
+
+    def decorator(func: F) -> F:
+        inflight: dict[str, asyncio.Future[Any]] = {}
+
+        @functools.wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            raw = args[0] if args else next(iter(kwargs.values()))
+            key = raw.strip().lower()
+
+            cached = cache.get(key)
+            if cached is not None:
+                logger.debug("♻️  Cache hit for %s: '%s'", func.__name__, key)
+                return cached
+
+            fut = inflight.get(key)
+            if fut is not None:
+                logger.debug("⏳ Awaiting in-flight %s for: '%s'", func.__name__, key)
+                return await fut
+
+            fut = asyncio.get_running_loop().create_future()
+            inflight[key] = fut
+            try:
+                result = await func(self, *args, **kwargs)
+            except Exception as e:
+                fut.set_exception(e)
+                # Mark the exception as retrieved so the future does not
+                # warn if no concurrent caller was awaiting it
+                fut.exception()
+                raise
+            else:
+                cache[key] = result
+                fut.set_result(result)
+                return result
+            finally:
+                inflight.pop(key, None)
+                if not fut.done():
+                    # The leader was cancelled before resolving (only
+                    # Exception is caught above); cancel the future so
+                    # duplicate waiters don't hang forever
+                    fut.cancel()
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def cache_clear() -> None:
+    """Clear all provider response caches (exposed via the admin endpoint)."""
+    for cache in (_books_cache, _author_cache, _works_cache):
+        cache.clear()
+    logger.info("🧹 Provider caches cleared")
+
+
+# Shared pooled client so every provider call reuses keep-alive connections
+# to openlibrary.org instead of paying a fresh TCP+TLS handshake per request.
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it lazily on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=httpx.Timeout(10.0),
+            # Ask for compressed bodies explicitly: search responses are
+            # large JSON blobs that gzip shrinks ~5-10x on the wire
+            headers={"Accept-Encoding": "gzip, deflate"},
         )
+        logger.info("🔌 Shared HTTP client created for %s", BASE_URL)
+    return _client
 
-    async def search_books(self, query: str) -> OpenLibrary:
-        logger.info(f"📚 Starting book search for query: '{query}'")
 
-        url = f"{self.base_url}/search.json?q={query}&format=json"
-        logger.debug(f"🌐 Making request to: {url}")
+async def aclose_client() -> None:
+    """Close the shared HTTP client (called from server shutdown hooks)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("🔌 Shared HTTP client closed")
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
 
-                # Log response status
-                logger.info(
-                    f"📡 API Response: {response.status_code} | Content-Length: {response.headers.get('content-length', 'unknown')}"
-                )
+# Shared quota tracker: every outbound request first waits out any active
+# penalty window, and every response feeds its rate-limit headers back in.
+rate_limit_state = RateLimitState()
 
-                if response.status_code != 200:
-                    logger.error(
-                        f"❌ API request failed with status {response.status_code}"
-                    )
-                    response.raise_for_status()
 
-                data = response.json()
+@retry_on_transient(max_attempts=3, base=0.5, cap=8.0)
+async def _get(path: str, params: dict[str, str] | None = None) -> httpx.Response:
+    """Issue a GET through the shared client, respecting upstream rate limits."""
+    await rate_limit_state.wait_if_throttled()
+    response = await get_client().get(path, params=params)
+    rate_limit_state.observe(response)
+    return response
 
-                # Log useful response metrics
-                num_found = data.get("num_found", 0)
-                docs_count = len(data.get("docs", []))
-                logger.info(
-                    f"✅ Search completed: {num_found} total books found, {docs_count} returned in response"
-                )
 
-                if docs_count > 0:
-                    logger.debug(
-                        f"📖 First book title: '{data['docs'][0].get('title', 'N/A')}'"
-                    )
+class OpenLibraryProvider:
+    def __init__(self) -> None:
+        self.base_url = BASE_URL
+
+    @_ttl_cached(_books_cache)
+    async def search_books(self, query: str) -> OpenLibrary:
+        logger.info("📚 Starting book search for query: '%s'", query)
+
+        logger.debug("🌐 Making request to: %s/search.json", self.base_url)
 
-                # Process response into model
-                result = OpenLibrary(**data)
-                logger.info(
-                    f"🎯 Successfully processed {len(result.docs)} book records"
+        try:
+            response = await _get("/search.json", params={"q": query, "format": "json"})
+
+            # Log response status
+            logger.info(
+                "📡 API Response: %s | Content-Length: %s",
+                response.status_code,
+                response.headers.get("content-length", "unknown"),
+            )
+
+            if response.status_code != 200:
+                logger.error(
+                    "❌ API request failed with status %s", response.status_code
+                )
+                response.raise_for_status()
+
+            data = orjson.loads(response.content)
+
+            # Log useful response metrics
+            num_found = data.get("num_found", 0)
+            docs_count = len(data.get("docs", []))
+            logger.info(
+                "✅ Search completed: %s total books found, %s returned in response",
+                num_found,
+                docs_count,
+            )
+
+            if docs_count > 0:
+                logger.debug(
+                    "📖 First book title: '%s'", data["docs"][0].get("title", "N/A")
                 )
 
-                return result
+            # Process response into model (bulk-validates docs in one call)
+            result = OpenLibrary.from_api(data)
+            logger.info("🎯 Successfully processed %s book records", len(result.docs))
+
+            return result
 
         except httpx.HTTPError as e:
-            logger.error(f"🚨 HTTP error occurred: {e}")
+            logger.error("🚨 HTTP error occurred: %s", e)
             raise
         except Exception as e:
-            logger.error(f"💥 Unexpected error during book search: {e}")
+            logger.error("💥 Unexpected error during book search: %s", e)
             raise
 
     async def search_author_with_book_name(self, query: str) -> AuthorDetails:
-        logger.info(f"📚 Starting author search for query: '{query}'")
-
-        url = "{url}/authors/{author_id}.json"
-        logger.debug(f"🌐 Making request to: {url}")
+        logger.info("📚 Starting author search for query: '%s'", query)
 
         try:
-            async with httpx.AsyncClient() as client:
-                book_response = await self.search_books(query=query)
-                logger.info(
-                    f"🎯 Successfully processed {len(book_response.docs)} book records"
-                )
-                logger.info(f"🆔 Author ID: {book_response.docs[0].author_key}")
-                author_id = book_response.docs[0].author_key
-                url = url.format(url=self.base_url, author_id=author_id)
-                logger.debug(f"🌐 Making request to: {url}")
-
-                response = await client.get(url)
-                logger.info(
-                    f"📡 API Response: {response.status_code} | Content-Length: {response.headers.get('content-length', 'unknown')}"
-                )
-
-                if response.status_code != 200:
-                    logger.error(
-                        f"❌ API request failed with status {response.status_code}"
+            book_response = await self.search_books(query=query)
+            logger.info(
+                "🎯 Successfully processed %s book records", len(book_response.docs)
+            )
+            logger.info("🆔 Author ID: %s", book_response.docs[0].author_key)
+            author_id = book_response.docs[0].author_key
+            logger.debug("🌐 Making request to: /authors/%s.json", author_id)
+
+            # The author detail and author works requests only depend on
+            # author_id, so run them concurrently; TaskGroup cancels the
+            # sibling request if one fails instead of letting it run on.
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    detail_task = tg.create_task(_get(f"/authors/{author_id}.json"))
+                    works_task = tg.create_task(
+                        self.search_author_works(author_id=author_id)
                     )
-                    response.raise_for_status()
+            except* Exception as eg:
+                # Unwrap so the handlers below see the original error
+                # rather than an ExceptionGroup
+                raise eg.exceptions[0] from None
+
+            response = detail_task.result()
+            author_works = works_task.result()
+            logger.info(
+                "📡 API Response: %s | Content-Length: %s",
+                response.status_code,
+                response.headers.get("content-length", "unknown"),
+            )
+
+            if response.status_code != 200:
+                logger.error(
+                    "❌ API request failed with status %s", response.status_code
+                )
+                response.raise_for_status()
 
-                data = response.json()
-                logger.info(f"🎯 Successfully processed {len(data)} author records")
+            data = orjson.loads(response.content)
+            logger.info("🎯 Successfully processed %s author records", len(data))
 
-                author_details = AuthorDetails(**data)
-                author_works = await self.search_author_works(author_id=author_id)
-                author_details.add_author_works(author_works)
-                logger.info(
-                    f"🎯 Successfully processed {len(author_details.works)} author works"
-                )
+            # model_validate hits the pydantic-core fast path directly instead
+            # of the logging __init__ wrapper
+            author_details = AuthorDetails.model_validate(data)
+            author_details.add_author_works(author_works)
+            logger.info(
+                "🎯 Successfully processed %s author works", len(author_details.works)
+            )
 
-                return author_details
+            return author_details
 
         except httpx.HTTPError as e:
-            logger.error(f"🚨 HTTP error occurred: {e}")
+            logger.error("🚨 HTTP error occurred: %s", e)
             raise
         except Exception as e:
-            logger.error(f"💥 Unexpected error during author search: {e}")
+            logger.error("💥 Unexpected error during author search: %s", e)
             raise
 
+    @_ttl_cached(_author_cache)
     async def search_author(self, query: str) -> AuthorDetails:
         """Search for author using OpenLibrary API"""
-        logger.info(f"📚 Starting author search for query: '{query}'")
+        logger.info("📚 Starting author search for query: '%s'", query)
 
-        url = f"{self.base_url}/search/authors.json?q={query}"
-        logger.debug(f"🌐 Making request to: {url}")
+        logger.debug("🌐 Making request to: %s/search/authors.json", self.base_url)
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                logger.info(
-                    f"📡 API Response: {response.status_code} | Content-Length: {response.headers.get('content-length', 'unknown')}"
+            response = await _get("/search/authors.json", params={"q": query})
+            logger.info(
+                "📡 API Response: %s | Content-Length: %s",
+                response.status_code,
+                response.headers.get("content-length", "unknown"),
+            )
+
+            if response.status_code != 200:
+                logger.error(
+                    "❌ API request failed with status %s", response.status_code
                 )
+                response.raise_for_status()
 
-                if response.status_code != 200:
-                    logger.error(
-                        f"❌ API request failed with status {response.status_code}"
-                    )
-                    response.raise_for_status()
+            data = orjson.loads(response.content)["docs"][0]
+            logger.info("🎯 Successfully processed %s author records", len(data))
 
-                data = response.json()["docs"][0]
-                logger.info(f"🎯 Successfully processed {len(data)} author records")
+            # model_validate hits the pydantic-core fast path directly instead
+            # of the logging __init__ wrapper
+            author_details = AuthorDetails.model_validate(data)
+            author_works = await self.search_author_works(author_id=author_details.key)
+            author_details.add_author_works(author_works)
+            logger.info(
+                "🎯 Successfully processed %s author works", len(author_details.works)
+            )
 
-                author_details = AuthorDetails(**data)
-                author_works = await self.search_author_works(
-                    author_id=author_details.key
-                )
-                author_details.add_author_works(author_works)
-                logger.info(
-                    f"🎯 Successfully processed {len(author_details.works)} author works"
-                )
-
-                return author_details
+            return author_details
 
         except httpx.HTTPError as e:
-            logger.error(f"🚨 HTTP error occurred: {e}")
+            logger.error("🚨 HTTP error occurred: %s", e)
             raise
         except Exception as e:
-            logger.error(f"💥 Unexpected error during author search: {e}")
+            logger.error("💥 Unexpected error during author search: %s", e)
             raise
 
+    @_ttl_cached(_works_cache)
     async def search_author_works(self, author_id: str) -> list[AuthorWorks]:
         """Search for author works using OpenLibrary API"""
-        logger.info(f"📚 Starting author works search for author ID: '{author_id}'")
+        logger.info("📚 Starting author works search for author ID: '%s'", author_id)
 
-        url = f"{self.base_url}/authors/{author_id}/works.json"
-        logger.debug(f"🌐 Making request to: {url}")
+        logger.debug("🌐 Making request to: /authors/%s/works.json", author_id)
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                logger.info(
-                    f"📡 API Response: {response.status_code} | Content-Length: {response.headers.get('content-length', 'unknown')}"
+            response = await _get(f"/authors/{author_id}/works.json")
+            logger.info(
+                "📡 API Response: %s | Content-Length: %s",
+                response.status_code,
+                response.headers.get("content-length", "unknown"),
+            )
+
+            if response.status_code != 200:
+                logger.error(
+                    "❌ API request failed with status %s", response.status_code
                 )
+                response.raise_for_status()
 
-                if response.status_code != 200:
-                    logger.error(
-                        f"❌ API request failed with status {response.status_code}"
-                    )
-                    response.raise_for_status()
-
-                data = response.json()["entries"]
-                logger.info(f"🎯 Successfully processed {len(data)} author works")
+            data = orjson.loads(response.content)["entries"]
+            logger.info("🎯 Successfully processed %s author works", len(data))
 
-                return [AuthorWorks(**work) for work in data]
+            # Bulk-validate the works list in one pydantic-core call
+            return WORKS_ADAPTER.validate_python(data)
 
         except httpx.HTTPError as e:
-            logger.error(f"🚨 HTTP error occurred: {e}")
+            logger.error("🚨 HTTP error occurred: %s", e)
             raise
         except Exception as e:
-            logger.error(f"💥 Unexpected error during author works search: {e}")
+            logger.error("💥 Unexpected error during author works search: %s", e)
             raise
+
+
+# Module-level singleton: the provider is stateless, so one instance serves
+# every request and is injected into endpoints via Depends(get_provider).
+provider = OpenLibraryProvider()
+logger.info("🔧 OpenLibraryProvider initialized with base_url: %s", BASE_URL)
+
+
+def get_provider() -> OpenLibraryProvider:
+    """Return the shared provider instance (FastAPI dependency)."""
+    return provider
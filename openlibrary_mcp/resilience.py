@@ -0,0 +1,363 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import secrets
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine
+from types import TracebackType
+from typing import Any, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    level=logging.INFO,
+)
+
+# Statuses that signal the upstream is overloaded or failing; both the
+# adaptive limiter and the circuit breaker treat them as backoff signals
+THROTTLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_RETRY_AFTER_CAP_SECONDS = 30.0
+
+# Statuses worth one more try: timeouts, throttling, and transient 5xx
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# SystemRandom avoids synchronized backoff across worker processes that
+# would otherwise share the default PRNG seed sequence
+_jitter = secrets.SystemRandom()
+
+# Task-local start time so concurrent calls through the same limiter each
+# measure their own latency
+_call_start: contextvars.ContextVar[float] = contextvars.ContextVar("_call_start")
+
+
+def _throttle_status(exc: BaseException | None) -> int | None:
+    """Return the HTTP status of an exception if it signals overload"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        if status in THROTTLE_STATUSES:
+            return status
+    return None
+
+
+class AdaptiveLimiter:
+    """
+    AIMD admission controller for outbound calls.
+
+    Concurrency capacity grows additively (+alpha) while calls succeed
+    below the latency target and shrinks multiplicatively (*beta) on
+    throttling responses or slow calls, matching outbound rate to what
+    the upstream can actually absorb. Used as an async context manager
+    around each provider call.
+    """
+
+    def __init__(
+        self,
+        initial: int = 16,
+        c_min: int = 1,
+        c_max: int = 32,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        target_latency: float = 2.0,
+        window: int = 20,
+    ) -> None:
+        self.c_min = float(c_min)
+        self.c_max = float(c_max)
+        self.alpha = alpha
+        self.beta = beta
+        self.target_latency = target_latency
+        self._capacity = min(max(float(initial), self.c_min), self.c_max)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    @property
+    def capacity(self) -> int:
+        """Current number of permits"""
+        return int(self._capacity)
+
+    def _increase(self) -> None:
+        self._capacity = min(self._capacity + self.alpha, self.c_max)
+
+    def _decrease(self) -> None:
+        self._capacity = max(self._capacity * self.beta, self.c_min)
+        logger.warning("📉 Outbound capacity reduced to %s permits", self.capacity)
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.capacity)
+            self._in_flight += 1
+        _call_start.set(time.perf_counter())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        latency = time.perf_counter() - _call_start.get()
+        self._latencies.append(latency)
+
+        status = _throttle_status(exc)
+        if status == 429:
+            # Honor the upstream penalty window before releasing the slot
+            # so queued callers do not immediately re-offend
+            retry_after = _parse_retry_after(exc)
+            if retry_after > 0:
+                logger.warning(
+                    "⏸️  429 from upstream, honoring Retry-After: %.1fs", retry_after
+                )
+                await asyncio.sleep(min(retry_after, _RETRY_AFTER_CAP_SECONDS))
+
+        async with self._cond:
+            if status is not None or latency > self.target_latency:
+                self._decrease()
+            elif exc is None:
+                self._increase()
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+
+def _parse_retry_after(exc: BaseException | None) -> float:
+    """Extract a Retry-After delay in seconds from a 429 error, if any"""
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return 0.0
+    value = exc.response.headers.get("retry-after")
+    if value is None:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        # HTTP-date form; too rare here to be worth parsing
+        return 0.0
+
+
+R = TypeVar("R")
+
+
+def retry_on_transient(
+    max_attempts: int = 3, base: float = 0.5, cap: float = 8.0
+) -> Callable[[Callable[..., Awaitable[R]]], Callable[..., Coroutine[Any, Any, R]]]:
+    """
+    Retry an async HTTP call on transient failures with full-jitter backoff.
+
+    Retries transport errors and responses with a retryable status
+    (408/429/500/502/503/504), sleeping a random fraction of the capped
+    exponential delay between attempts. On the final attempt the original
+    exception is re-raised (or the response returned) unchanged so
+    callers see the real failure, not a wrapper.
+
+    Args:
+        max_attempts: Total attempts including the first
+        base: Backoff base delay in seconds
+        cap: Upper bound on the backoff delay in seconds
+
+    Returns:
+        Decorator wrapping the coroutine with bounded retries
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[R]],
+    ) -> Callable[..., Coroutine[Any, Any, R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: object, **kwargs: object) -> R:
+            for attempt in range(1, max_attempts + 1):
+                reason: object
+                try:
+                    result = await func(*args, **kwargs)
+                except httpx.TransportError as e:
+                    if attempt == max_attempts:
+                        raise
+                    reason = e
+                else:
+                    status = getattr(result, "status_code", None)
+                    if status not in RETRYABLE_STATUSES or attempt == max_attempts:
+                        return result
+                    reason = f"status {status}"
+
+                delay = min(cap, base * 2 ** (attempt - 1)) * _jitter.random()
+                logger.warning(
+                    "🔁 Transient failure (%s), retry %s/%s in %.2fs",
+                    reason,
+                    attempt,
+                    max_attempts - 1,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+            raise AssertionError("unreachable")  # loop always returns or raises
+
+        return wrapper
+
+    return decorator
+
+
+def _to_int(value: str) -> int | None:
+    """Parse an integer rate-limit header value, ignoring junk"""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class RateLimitState:
+    """
+    Quota tracker that throttles proactively instead of waiting for 429s.
+
+    After each response, observe() records x-ratelimit-* and Retry-After
+    headers; wait_if_throttled() pauses the next request while a penalty
+    window is active or when remaining quota drops below the low-water
+    mark. A local sliding-window requests-per-minute counter backstops
+    endpoints that omit rate-limit headers entirely.
+    """
+
+    def __init__(
+        self,
+        max_rpm: int = 120,
+        low_water: float = 0.1,
+        low_water_pause: float = 1.0,
+    ) -> None:
+        self.max_rpm = max_rpm
+        self.low_water = low_water
+        self.low_water_pause = low_water_pause
+        self._limit: int | None = None
+        self._remaining: int | None = None
+        self._resume_at = 0.0
+        self._sent: deque[float] = deque()
+
+    def observe(self, response: httpx.Response) -> None:
+        """Record rate-limit signals from an upstream response"""
+        retry_after = response.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                self._resume_at = time.monotonic() + max(0.0, float(retry_after))
+            except ValueError:
+                pass
+
+        # Header names vary across deployments (x-ratelimit-remaining,
+        # x-ratelimit-remaining-minute, ...), so match on the prefix
+        for name, value in response.headers.items():
+            if name.startswith("x-ratelimit-limit"):
+                self._limit = _to_int(value) or self._limit
+            elif name.startswith("x-ratelimit-remaining"):
+                self._remaining = _to_int(value)
+
+    def _delay(self) -> float:
+        now = time.monotonic()
+        if now < self._resume_at:
+            return self._resume_at - now
+
+        if (
+            self._limit
+            and self._remaining is not None
+            and self._remaining / self._limit < self.low_water
+        ):
+            return self.low_water_pause
+
+        while self._sent and now - self._sent[0] > 60.0:
+            self._sent.popleft()
+        if len(self._sent) >= self.max_rpm:
+            return 60.0 - (now - self._sent[0])
+
+        return 0.0
+
+    async def wait_if_throttled(self) -> None:
+        """Pause before a request when quota is (nearly) exhausted"""
+        delay = self._delay()
+        if delay > 0:
+            logger.warning("⏸️  Approaching upstream rate limit, pausing %.1fs", delay)
+            await asyncio.sleep(min(delay, _RETRY_AFTER_CAP_SECONDS))
+        self._sent.append(time.monotonic())
+
+
+def _is_upstream_failure(exc: BaseException | None) -> bool:
+    """True only for errors that indicate the upstream itself is unhealthy"""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return _throttle_status(exc) is not None
+
+
+class CircuitBreakerOpenError(RuntimeError):
+    """Raised when a call is short-circuited by an open circuit breaker."""
+
+
+class CircuitBreaker:
+    """
+    Open/half-open/closed breaker over a sliding window of outcomes.
+
+    Only upstream-health failures count: transport errors and throttling
+    statuses (THROTTLE_STATUSES). Application-level errors such as a
+    no-result query raising downstream are recorded as successes — the
+    upstream answered — and cancellations are not recorded at all. When
+    the failure ratio over the window exceeds the threshold, calls are
+    rejected immediately for the cooldown period instead of piling onto
+    a failing upstream. After the cooldown, one trial call is let
+    through; success closes the circuit, failure reopens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        window: int = 20,
+        min_samples: int = 5,
+        cooldown: float = 15.0,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._opened_at: float | None = None
+        self._half_open = False
+
+    async def __aenter__(self) -> "CircuitBreaker":
+        if self._opened_at is not None:
+            elapsed = time.monotonic() - self._opened_at
+            if elapsed < self.cooldown:
+                raise CircuitBreakerOpenError(
+                    f"Circuit open, retry in {self.cooldown - elapsed:.1f}s"
+                )
+            # Cooldown elapsed: allow one trial call (half-open)
+            self._half_open = True
+            logger.info("🔃 Circuit breaker half-open, allowing trial call")
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if isinstance(exc, asyncio.CancelledError):
+            # A client disconnect says nothing about upstream health;
+            # leave the breaker state untouched (a half-open trial stays
+            # available for the next caller)
+            self._half_open = False
+            return
+
+        failed = _is_upstream_failure(exc)
+        self._outcomes.append(not failed)
+
+        if self._half_open:
+            self._half_open = False
+            if failed:
+                self._opened_at = time.monotonic()
+                logger.warning("⛔ Circuit breaker reopened after failed trial")
+            else:
+                self._opened_at = None
+                self._outcomes.clear()
+                logger.info("✅ Circuit breaker closed after successful trial")
+            return
+
+        if len(self._outcomes) >= self.min_samples:
+            failure_ratio = 1 - (sum(self._outcomes) / len(self._outcomes))
+            if failure_ratio >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                logger.warning(
+                    "⛔ Circuit breaker opened (failure ratio %.0f%%)",
+                    failure_ratio * 100,
+                )